@@ -1,58 +1,266 @@
 import os
+import logging
 import csv
 import time
 import schedule
 import random
+import re
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from threading import Thread
+from threading import Thread, Event, RLock
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
+from slack_sdk import WebClient
+from slack_sdk.errors import SlackApiError
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 from zoneinfo import ZoneInfo
 import json
+import inspect
+import tempfile
+from functools import lru_cache
 
 __version__ = "0.1.0"
 
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logging.getLogger("slack_bolt").setLevel(logging.WARNING)
+logger = logging.getLogger("journalbot")
+
+# === LOAD ENVIRONMENT VARIABLES ===
+env_path = Path('.') / '.env'
+load_dotenv(dotenv_path=env_path)
+
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    slack_api_token: str
+    slack_app_token: str
+    admin_user_id: str  # Your Slack user ID
+    journal_channel_id: str
+    birthday_channel_id: str
+    group_webpage_url: str
+    timezone: str
+
+
+def load_env():
+    """Read the environment once at startup, failing with a clear message if required vars are missing."""
+    required = ["SLACK_API_TOKEN", "SLACK_APP_TOKEN", "ADMIN_USER_ID", "JOURNAL_CHANNEL_ID"]
+    missing = [name for name in required if not os.environ.get(name)]
+    if missing:
+        raise SystemExit(f"Missing required environment variables: {', '.join(missing)}")
+    return Env(
+        slack_api_token=os.environ["SLACK_API_TOKEN"],
+        slack_app_token=os.environ["SLACK_APP_TOKEN"],
+        admin_user_id=os.environ["ADMIN_USER_ID"],
+        journal_channel_id=os.environ["JOURNAL_CHANNEL_ID"],
+        birthday_channel_id=os.environ.get("BIRTHDAY_CHANNEL_ID", ""),
+        group_webpage_url=os.environ.get("GROUP_WEBPAGE_URL", ""),
+        timezone=os.environ.get("TIMEZONE", "America/Santiago"),  # Default timezone
+    )
+
+
+ENV = load_env()
+
 # Schedule birthday greetings daily at 9 AM
 HH, MM = 12, 30
-TIMEZONE = os.environ.get("TIMEZONE", "America/Santiago")  # Default timezone
+APP_TZ = ZoneInfo(ENV.timezone)
 
 # === JOURNAL CLUB PRESENTER FUNCTIONS ===
 DATA_DIR = "data/"
 PRESENTED_FILE = DATA_DIR + "presented.csv"
 MEMBERS_FILE = DATA_DIR + "members.csv"
-REMINDER_FILE = DATA_DIR + "reminder.csv"
+NEXT_PRESENTER_FILE = DATA_DIR + "next_presenter.json"
+LEGACY_REMINDER_FILE = DATA_DIR + "reminder.csv"  # Replaced by NEXT_PRESENTER_FILE; migrated on first read
 
-# === LOAD ENVIRONMENT VARIABLES ===
-env_path = Path('.') / '.env'
-load_dotenv(dotenv_path=env_path)
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+WEEKDAY_SET = frozenset(WEEKDAYS)
+
+# Row schema shared by members.csv and presented.csv
+Member = namedtuple("Member", "name user_id date journal_club")
 
 # Initialize Slack app
-app = App(token=os.environ["SLACK_API_TOKEN"])
-AUTHORIZED_USER_ID = os.environ["ADMIN_USER_ID"]  # Your Slack user ID
-JOURNAL_CHANNEL_ID = os.environ["JOURNAL_CHANNEL_ID"]
+app = App(token=ENV.slack_api_token)
+
+
+def admin_only(handler):
+    """Ack a slash command and run `handler` only if the admin user sent it."""
+    handler_args = inspect.signature(handler).parameters
+    reply_with = "respond" if "respond" in handler_args else "say"
+
+    # Bolt injects arguments by parameter name, so the wrapper declares everything it may forward
+    def wrapper(ack, body, say, respond, command):
+        ack()
+        user_id = body["user_id"]
+        available = {"ack": ack, "body": body, "say": say, "respond": respond, "command": command}
+        if user_id != ENV.admin_user_id:
+            available[reply_with](f"Sorry <@{user_id}>, you're not authorized to run this command.")
+            return
+        return handler(**{name: available[name] for name in handler_args})
+
+    # Copy these by hand rather than using functools.wraps: Bolt resolves listener arguments via
+    # inspect.getfullargspec(inspect.unwrap(func)), so the __wrapped__ set by wraps would make it
+    # inject the handler's parameters instead of the wrapper's, and ack/body would never be passed
+    wrapper.__name__ = handler.__name__
+    wrapper.__doc__ = handler.__doc__
+    return wrapper
 
 
 CONFIG_FILE = DATA_DIR + "config.json"
 
+# Longest the scheduler thread sleeps before re-checking pending jobs
+MAX_SCHEDULER_SLEEP = 3600
+
+# Set to wake the scheduler thread early (e.g. after jobs are rescheduled)
+scheduler_wakeup = Event()
+
+# Guards config globals and the in-memory caches below; never hold it across I/O
+_state_lock = RLock()
+
+# Parsed CSV rows keyed by path, stored as
+# (st_mtime_ns, st_size, rows, rows_by_user_id, rows_by_birthday)
+_csv_cache = {}
+
+
+def birthday_key(date):
+    """Pack an mm-dd date into month * 100 + day, or None if it is empty/malformed."""
+    month, sep, day = date.partition("-")
+    if not (sep and month.isdecimal() and day.isdecimal()):
+        return None
+    return int(month) * 100 + int(day)
+
+
+def _load_csv(path):
+    """Return the cache entry for a CSV file, re-parsing only when the file changed on disk."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    with _state_lock:
+        hit = _csv_cache.get(path)
+    if hit and hit[:2] == key:
+        return hit
+    with open(path, newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            rows = []
+        else:
+            # Map columns by header name so the on-disk column order does not matter;
+            # missing columns and short hand-edited rows read as ""
+            columns = [header.index(field) if field in header else None for field in Member._fields]
+            padding = [""] * len(header)
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                row += padding
+                rows.append(Member._make("" if i is None else row[i] for i in columns))
+    by_id = {row.user_id: row for row in rows}
+    by_birthday = {}
+    for row in rows:
+        md = birthday_key(row.date)
+        if md is not None:  # Members without a birthday are left out
+            by_birthday.setdefault(md, []).append(row)
+    entry = (*key, rows, by_id, by_birthday)
+    with _state_lock:
+        _csv_cache[path] = entry
+    return entry
+
+
+def read_csv_cached(path):
+    return _load_csv(path)[2]
+
+
+def read_csv_by_id(path):
+    return _load_csv(path)[3]
+
 
-# Load config with defaults if file doesn't exist
+def read_csv_by_birthday(path):
+    return _load_csv(path)[4]
+
+
+def invalidate_csv_cache(path):
+    with _state_lock:
+        _csv_cache.pop(path, None)
+
+
+def atomic_write(path, write_fn):
+    """Write a file via a temp file + os.replace so readers never see a partial file."""
+    # A unique temp file in the same directory, so concurrent writers don't collide and the rename stays atomic
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            write_fn(f)
+            # Make sure the data is on disk before the rename makes it visible
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+# Workspace user names cached from users.list, refreshed after USER_NAMES_TTL seconds
+USER_NAMES_TTL = 60
+_user_names_cache = {"fetched_at": 0.0, "names": {}}
+
+
+def get_user_names():
+    """Return {user_id: real_name} for the workspace, paging users.list once per TTL."""
+    if time.monotonic() - _user_names_cache["fetched_at"] < USER_NAMES_TTL:
+        return _user_names_cache["names"]
+
+    names = {}
+    cursor = None
+    while True:
+        response = call_slack(app.client.users_list, cursor=cursor, limit=1000)
+        for user in response["members"]:
+            names[user["id"]] = user.get("real_name") or user["name"]
+        cursor = response.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+
+    _user_names_cache["names"] = names
+    _user_names_cache["fetched_at"] = time.monotonic()
+    return names
+
+
+DEFAULT_CONFIG = {
+    "meeting_day": "monday",
+    "reminder_day": "thursday",
+    "reminder_hour": "23:01"
+}
+
+
+# Load config with defaults if file doesn't exist; parsed once and reused until save_config
+@lru_cache(maxsize=1)
 def load_config():
-    if os.path.exists(CONFIG_FILE):
+    try:
         with open(CONFIG_FILE, "r") as f:
             return json.load(f)
-    return {
-        "meeting_day": "monday",
-        "reminder_day": "thursday",
-        "reminder_hour": "23:01"
-    }
+    except FileNotFoundError:
+        pass
+    return dict(DEFAULT_CONFIG)
+
+
+# Save config to file and refresh the in-memory copy
+def save_config(new_config):
+    atomic_write(CONFIG_FILE, lambda f: json.dump(new_config, f))
+    load_config.cache_clear()
+    with _state_lock:
+        config.update(new_config)  # Update in place so existing references stay valid
 
 
-# Save config to file
-def save_config(config):
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f)
+def parse_hour(text):
+    """Parse a 24h HH:MM string into (hour, minute), or return None if it is invalid."""
+    hour, sep, minute = text.partition(":")
+    # 1-2 digits each, as time.strptime("%H:%M") accepted before (e.g. "9:5")
+    if not (sep and hour.isdecimal() and minute.isdecimal() and len(hour) <= 2 and len(minute) <= 2):
+        return None
+    hour, minute = int(hour), int(minute)
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        return hour, minute
+    return None
 
 
 # Load initial config
@@ -62,32 +270,59 @@ config = load_config()
 MEETING_DAY = config["meeting_day"]
 REMINDER_DAY = config["reminder_day"]
 REMINDER_HOUR = config["reminder_hour"]
+if parse_hour(REMINDER_HOUR) is None:
+    logger.error("Invalid reminder_hour %r in %s; using %s", REMINDER_HOUR, CONFIG_FILE, DEFAULT_CONFIG["reminder_hour"])
+    REMINDER_HOUR = DEFAULT_CONFIG["reminder_hour"]
+REMINDER_H, REMINDER_M = parse_hour(REMINDER_HOUR)
+
+
+# Armed jobs by tag, stored as (job, (day, server_time)); replaced by reload_schedules()
+_armed_jobs = {}
+
+
+def arm_job(tag, day, server_time_str, job_func, not_before=None):
+    """Schedule job_func on `day` at server_time_str under `tag`; False if already armed at that time.
+
+    `not_before` is the naive server-local datetime of the next occurrence in the app timezone.
+    """
+    with _state_lock:
+        old = _armed_jobs.get(tag)
+        if old is not None and old[1] == (day, server_time_str):
+            return False
+        # Arm the new job before cancelling the old one so there is never a window without it
+        job = getattr(schedule.every(), day).at(server_time_str).do(job_func).tag(tag)
+        if old is not None:
+            job.last_run = old[0].last_run
+        # A shifted time (e.g. after a DST change) must not fire again for an occurrence that already ran
+        if not_before is not None and job.next_run < not_before:
+            job.next_run = not_before
+        _armed_jobs[tag] = (job, (day, server_time_str))
+        if old is not None:
+            schedule.cancel_job(old[0])
+    return True
 
 
 def reload_schedules():
-    """Clear existing reminder jobs and reschedule with new config."""
-    global MEETING_DAY, REMINDER_DAY, REMINDER_HOUR
-    schedule.clear("weekly_reminder")  # Remove old weekly reminder
-
-    # Convert REMINDER_HOUR to server time if needed
-    server_time_str = get_server_time_for_santiago(
-        int(REMINDER_HOUR.split(":")[0]),
-        int(REMINDER_HOUR.split(":")[1])
-    )
+    """Arm the birthday and reminder jobs at the server times matching the current config."""
+    with _state_lock:
+        reminder_day, reminder_h, reminder_m = REMINDER_DAY, REMINDER_H, REMINDER_M
 
-    # Schedule the reminder using the schedule library only
-    getattr(schedule.every(), REMINDER_DAY).at(server_time_str).do(send_journal_reminder).tag("weekly_reminder")
-    print(f"🔄 Scheduler reloaded with: {REMINDER_DAY} at {server_time_str} (server time)")
+    # Convert app-timezone times to server time if needed; the reminder's weekday can shift too
+    birthday_day, birthday_time_str, birthday_next = get_server_time_for_santiago(HH, MM)
+    server_day, server_time_str, reminder_next = get_server_time_for_santiago(reminder_h, reminder_m, reminder_day)
 
+    changed = arm_job("daily_birthdays", birthday_day, birthday_time_str, check_and_send_birthday_messages,
+                      birthday_next)
+    changed |= arm_job("weekly_reminder", server_day, server_time_str, send_journal_reminder, reminder_next)
+    if changed:
+        scheduler_wakeup.set()  # Let the scheduler thread pick up the new next run
+        logger.info("🔄 Scheduler reloaded with: birthdays daily at %s, reminder %s at %s (server time)",
+                    birthday_time_str, server_day, server_time_str)
 
-@app.command("/configure_meeting")
-def handle_configure_meeting(ack, body, say):
-    ack()
-    user_id = body["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        say(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
 
+@app.command("/configure_meeting")
+@admin_only
+def handle_configure_meeting(body, say):
     # Expect format: /configure_meeting meeting_day reminder_day reminder_hour
     # Example: /configure_meeting monday thursday 15:30
     text = body.get("text", "").strip().lower()
@@ -98,34 +333,32 @@ def handle_configure_meeting(ack, body, say):
         return
 
     meeting_day, reminder_day, reminder_hour = parts
-    valid_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-
-    if meeting_day not in valid_days or reminder_day not in valid_days:
-        say(f"Days must be one of: {', '.join(valid_days)}")
+    if meeting_day not in WEEKDAY_SET or reminder_day not in WEEKDAY_SET:
+        say(f"Days must be one of: {', '.join(WEEKDAYS)}")
         return
 
-    try:
-        time.strptime(reminder_hour, "%H:%M")
-    except ValueError:
+    parsed_hour = parse_hour(reminder_hour)
+    if parsed_hour is None:
         say("Reminder hour must be in HH:MM format (24h).")
         return
 
-    # Update config and save
-    config["meeting_day"] = meeting_day
-    config["reminder_day"] = reminder_day
-    config["reminder_hour"] = reminder_hour
-    save_config(config)
-
-    # Update globals
-    global MEETING_DAY, REMINDER_DAY, REMINDER_HOUR
-    MEETING_DAY = meeting_day
-    REMINDER_DAY = reminder_day
-    REMINDER_HOUR = reminder_hour
+    # Update config and globals, then save a snapshot outside the lock
+    global MEETING_DAY, REMINDER_DAY, REMINDER_HOUR, REMINDER_H, REMINDER_M
+    with _state_lock:
+        config["meeting_day"] = meeting_day
+        config["reminder_day"] = reminder_day
+        config["reminder_hour"] = reminder_hour
+        MEETING_DAY = meeting_day
+        REMINDER_DAY = reminder_day
+        REMINDER_HOUR = reminder_hour
+        REMINDER_H, REMINDER_M = parsed_hour
+        config_snapshot = dict(config)
+    save_config(config_snapshot)
 
     # Reload scheduler so changes take effect immediately
     reload_schedules()
 
-    say(f"✅ Configuration updated!\n- Meeting day: {MEETING_DAY.capitalize()}\n- Reminder day: {REMINDER_DAY.capitalize()}\n- Reminder time: {REMINDER_HOUR}")
+    say(f"✅ Configuration updated!\n- Meeting day: {meeting_day.capitalize()}\n- Reminder day: {reminder_day.capitalize()}\n- Reminder time: {reminder_hour}")
 
 
 @app.message("hello")
@@ -134,110 +367,219 @@ def message_hello(message, say):
     say(f"Hey there <@{message['user']}>!")
 
 
+# Sends scheduled messages off the scheduler thread so slow Slack calls don't delay other jobs
+_message_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack-post")
+
+# slack_sdk has no per-call timeout, so scheduled posts use their own client with a short one
+# instead of app.client's 30 s default; a hung request then can't hold a pool worker for long
+SLACK_POST_TIMEOUT = 10
+_post_client = WebClient(token=ENV.slack_api_token, timeout=SLACK_POST_TIMEOUT)
+
+
+def call_slack(method, **kwargs):
+    """Call a Slack Web API method, retrying once after Retry-After if the call is rate-limited."""
+    try:
+        return method(**kwargs)
+    except SlackApiError as e:
+        if e.response.get("error") != "ratelimited":
+            raise
+        time.sleep(int(e.response.headers.get("Retry-After", 1)))
+        return method(**kwargs)
+
+
+def post_message(channel, text):
+    return call_slack(_post_client.chat_postMessage, channel=channel, text=text)
+
+
+def fetch_user_names(user_ids, max_workers=8):
+    """Look up {user_id: real_name} with concurrent users.info calls."""
+    names = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(call_slack, app.client.users_info, user=user_id): user_id for user_id in user_ids}
+        for future in as_completed(futures):
+            user = future.result()["user"]
+            names[futures[future]] = user.get("real_name") or user["name"]
+    return names
+
+
 # === BIRTHDAY GREETINGS FUNCTION ===
+def send_birthday_message(member):
+    try:
+        post_message(
+            ENV.birthday_channel_id,
+            f"🎉 Happy Birthday <@{member.user_id}>! Wishing you an amazing day! 🎂"
+        )
+        logger.info("Sent birthday message to %s (%s)", member.name, member.user_id)
+    except Exception as e:
+        logger.error("Failed to send birthday message to %s: %s", member.name, e)
+
+
 def check_and_send_birthday_messages():
-    if not os.path.exists(MEMBERS_FILE):
-        print("Members file not found.")
+    try:
+        members_by_birthday = read_csv_by_birthday(MEMBERS_FILE)
+    except FileNotFoundError:
+        logger.warning("Members file not found.")
         return
-    today = datetime.now(ZoneInfo(TIMEZONE)).strftime("%m-%d")
-    with open(MEMBERS_FILE, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            if not row["date"]:
-                continue  # Skip members with no birthday
-            if row["date"] == today:
-                user_id = row["user_id"]
-                name = row["name"]
-                channel_id = os.getenv("BIRTHDAY_CHANNEL_ID") or ""
-                try:
-                    app.client.chat_postMessage(
-                        channel=channel_id,
-                        text=f"🎉 Happy Birthday <@{user_id}>! Wishing you an amazing day! 🎂"
-                    )
-                    print(f"Sent birthday message to {name} ({user_id})")
-                except Exception as e:
-                    print(f"Failed to send birthday message to {name}: {e}")
+    now = datetime.now(APP_TZ)
+    for row in members_by_birthday.get(now.month * 100 + now.day, ()):
+        _message_pool.submit(send_birthday_message, row)
+
+
+# (cached members.csv rows, journal club participants filtered from them)
+_journal_club_members = (None, [])
 
 
 def get_all_members():
-    with open(MEMBERS_FILE, newline='') as csvfile:
-        members = list(csv.DictReader(csvfile))
+    global _journal_club_members
+    members = read_csv_cached(MEMBERS_FILE)
+    cached_rows, cached_members = _journal_club_members
+    if cached_rows is members:
+        return cached_members
 
     # Keep only members who have not opted out of journal club
-    members = [
+    filtered = [
         m for m in members
-        if m.get("journal_club", "").strip().lower() != "no"
+        if m.journal_club.strip().lower() != "no"
     ]
-    return members
+    with _state_lock:
+        _journal_club_members = (members, filtered)
+    return filtered
 
 
 def get_presented_members():
-    if not os.path.exists(PRESENTED_FILE):
+    try:
+        return read_csv_cached(PRESENTED_FILE)
+    except FileNotFoundError:
         return []
-    with open(PRESENTED_FILE, newline='') as csvfile:
-        return list(csv.DictReader(csvfile))
+
+
+# User IDs that already presented; loaded from presented.csv on first use
+_presented_ids = None
+
+
+def get_presented_ids():
+    global _presented_ids
+    if _presented_ids is None:
+        presented_ids = {row.user_id for row in get_presented_members()}
+        with _state_lock:
+            if _presented_ids is None:
+                _presented_ids = presented_ids
+    return _presented_ids
 
 
 def save_presented_member(member):
-    fieldnames = ["name", "user_id", "date", "journal_club"]
-    write_header = not os.path.exists(PRESENTED_FILE)
     with open(PRESENTED_FILE, mode='a', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        if write_header:
+        writer = csv.DictWriter(csvfile, fieldnames=Member._fields)
+        if csvfile.tell() == 0:  # Append mode starts at the end, so 0 means a new/empty file
             writer.writeheader()
-        writer.writerow(member)
+        writer.writerow(member._asdict())
+    invalidate_csv_cache(PRESENTED_FILE)
+    presented_ids = get_presented_ids()
+    with _state_lock:
+        presented_ids.add(member.user_id)
 
 
 def reset_presented_list():
-    if os.path.exists(PRESENTED_FILE):
+    global _presented_ids
+    try:
         os.remove(PRESENTED_FILE)
+    except FileNotFoundError:
+        pass
+    invalidate_csv_cache(PRESENTED_FILE)
+    with _state_lock:
+        _presented_ids = set()
+
+
+# (journal club member list it was built from, members not yet picked this round)
+_remaining_presenters = (None, [])
 
 
 def select_random_presenter():
+    global _remaining_presenters
     members = get_all_members()
-    presented = get_presented_members()
-    presented_ids = {row["user_id"] for row in presented}
-    remaining = [m for m in members if m["user_id"] not in presented_ids]
+    presented_ids = get_presented_ids()  # May read presented.csv, so load it before taking the lock
 
-    if not remaining:
-        reset_presented_list()
-        remaining = members
+    with _state_lock:
+        source, remaining = _remaining_presenters
+        if source is not members:
+            # members.csv changed (or first call): rebuild from the presented history
+            remaining = [m for m in members if m.user_id not in presented_ids]
+
+        start_new_round = not remaining
+        if start_new_round:
+            remaining = list(members)
 
-    selected = random.choice(remaining)
+        # Swap the pick to the end and pop it: O(1) removal
+        idx = random.randrange(len(remaining))
+        remaining[idx], remaining[-1] = remaining[-1], remaining[idx]
+        selected = remaining.pop()
+        _remaining_presenters = (members, remaining)
+
+    if start_new_round:
+        reset_presented_list()
     save_presented_member(selected)
 
     # Save for reminder
-    with open(REMINDER_FILE, "w", newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=["name", "user_id", "date", "journal_club"])
-        writer.writeheader()
-        writer.writerow(selected)
+    save_next_presenter(selected)
 
     return selected
 
 
+# Presenter picked for the next meeting; persisted so a restart keeps it
+_next_presenter = None
+
+
+def save_next_presenter(member):
+    global _next_presenter
+    atomic_write(NEXT_PRESENTER_FILE, lambda f: json.dump(member._asdict(), f))
+    with _state_lock:
+        _next_presenter = member
+
+
+def migrate_legacy_reminder():
+    """Move a presenter picked by an older version from reminder.csv to NEXT_PRESENTER_FILE."""
+    try:
+        with open(LEGACY_REMINDER_FILE, newline='') as f:
+            row = next(csv.DictReader(f), None)
+    except FileNotFoundError:
+        return None
+    if row is None:
+        member = None
+    else:
+        member = Member._make(row.get(field) or "" for field in Member._fields)
+        save_next_presenter(member)
+        logger.info("Migrated next presenter %s from %s", member.name, LEGACY_REMINDER_FILE)
+    os.remove(LEGACY_REMINDER_FILE)
+    return member
+
+
+def get_next_presenter():
+    """Return the selected presenter, reading it from disk only on a cold start."""
+    global _next_presenter
+    if _next_presenter is None:
+        try:
+            with open(NEXT_PRESENTER_FILE) as f:
+                member = Member(**json.load(f))
+        except FileNotFoundError:
+            return migrate_legacy_reminder()
+        with _state_lock:
+            if _next_presenter is None:
+                _next_presenter = member
+    return _next_presenter
+
+
 # === COMMAND TO SELECT PRESENTER ===
 @app.command("/select_presenter")
-def handle_select_presenter(ack, body, say):
-    ack()
-    user_id = body["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        say(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
-
+@admin_only
+def handle_select_presenter(say):
     selected = select_random_presenter()
-    say(f"📢 The next journal club presenter is <@{selected['user_id']}>! 🎓")
-    print(f"Selected {selected['name']} for journal club.")
+    say(f"📢 The next journal club presenter is <@{selected.user_id}>! 🎓")
+    logger.info("Selected %s for journal club.", selected.name)
 
 
 @app.command("/get_channel_members")
-def handle_get_channel_members(ack, body, say):
-    ack()
-
-    user_id = body["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        say(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
-
+@admin_only
+def handle_get_channel_members(body, say):
     text = body.get("text", "").strip()
     if not text:
         say("Please provide the channel ID. Example: `/get_channel_members C12345678`")
@@ -249,17 +591,19 @@ def handle_get_channel_members(ack, body, say):
         members = []
         cursor = None
         while True:
-            response = app.client.conversations_members(channel=channel_id, cursor=cursor)
+            response = call_slack(app.client.conversations_members, channel=channel_id, cursor=cursor, limit=1000)
             members.extend(response["members"])
             cursor = response.get("response_metadata", {}).get("next_cursor")
             if not cursor:
                 break
 
-        results = []
-        for member_id in members:
-            user_info = app.client.users_info(user=member_id)
-            user_name = user_info["user"]["real_name"]  # or user_info["user"]["profile"]["display_name"]
-            results.append(f"{user_name} (`{member_id}`)")
+        user_names = get_user_names()
+        # Members who joined after the cached users.list snapshot
+        missing = [member_id for member_id in members if member_id not in user_names]
+        if missing:
+            user_names = {**user_names, **fetch_user_names(missing)}
+
+        results = [f"{user_names[member_id]} (`{member_id}`)" for member_id in members]
 
         say(f"Found {len(results)} members in <#{channel_id}>:\n" + "\n".join(results))
 
@@ -269,82 +613,96 @@ def handle_get_channel_members(ack, body, say):
 
 # === REMINDER FUNCTION ===
 def send_journal_reminder():
-    if not os.path.exists(REMINDER_FILE):
-        print("No upcoming presenter found.")
+    selected = get_next_presenter()
+    if selected is None:
+        logger.info("No upcoming presenter found.")
         return
 
-    with open(REMINDER_FILE, newline='') as f:
-        reader = csv.DictReader(f)
-        selected = next(reader, None)
+    with _state_lock:
+        meeting_day = MEETING_DAY
 
-    if selected:
-        try:
-            app.client.chat_postMessage(
-                channel=selected["user_id"],
-                text=f"🔔 Reminder: You are presenting in the next journal club on {MEETING_DAY.capitalize()}. "
-                     f"Please submit the paper in <#{JOURNAL_CHANNEL_ID}> before then!"
-            )
-            print(f"Reminder sent to {selected['name']}")
-        except Exception as e:
-            print(f"Failed to send reminder: {e}")
+    try:
+        post_message(
+            selected.user_id,
+            f"🔔 Reminder: You are presenting in the next journal club on {meeting_day.capitalize()}. "
+            f"Please submit the paper in <#{ENV.journal_channel_id}> before then!"
+        )
+        logger.info("Reminder sent to %s", selected.name)
+    except Exception as e:
+        logger.error("Failed to send reminder: %s", e)
+
+
+def _server_shares_app_tz():
+    """True if the server's local offset matches the app timezone at weekly probes over the next year."""
+    now = datetime.now(APP_TZ)
+    probes = (now + timedelta(days=d) for d in range(0, 366, 7))
+    return all(p.utcoffset() == p.astimezone().utcoffset() for p in probes)
+
+
+# When the server already runs in the app timezone no conversion is needed
+SERVER_SHARES_APP_TZ = _server_shares_app_tz()
+
+
+def get_server_time_for_santiago(hour, minute, weekday=None):
+    """Return (schedule day, server HH:MM, server datetime) for the next hour:minute in the app timezone.
+
+    The schedule day is "day" for a daily job, or the server-local weekday of the next
+    occurrence on `weekday`, which differs from `weekday` when the conversion crosses midnight.
+    The datetime is None when the server shares the app timezone and schedule's own next run is right.
+    """
+    if SERVER_SHARES_APP_TZ:
+        return weekday or "day", f"{hour:02d}:{minute:02d}", None
 
+    now_santiago = datetime.now(APP_TZ)
+    target_day = now_santiago.date()
+    if weekday is not None:
+        target_day += timedelta(days=(WEEKDAYS.index(weekday) - target_day.weekday()) % 7)
 
-def get_server_time_for_santiago(hour, minute):
-    santiago_tz = ZoneInfo(TIMEZONE)
-    server_tz = datetime.now().astimezone().tzinfo
+    if now_santiago.replace(year=target_day.year, month=target_day.month, day=target_day.day,
+                            hour=hour, minute=minute, second=0, microsecond=0) < now_santiago:
+        target_day += timedelta(days=1 if weekday is None else 7)
 
-    now_santiago = datetime.now(santiago_tz)
-    target_dt_santiago = now_santiago.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    server_weekday, server_time_str, server_dt = _server_time(hour, minute, target_day)
+    return server_weekday if weekday is not None else "day", server_time_str, server_dt
 
-    if target_dt_santiago < now_santiago:
-        target_dt_santiago += timedelta(days=1)
 
-    target_dt_server = target_dt_santiago.astimezone(server_tz)
-    return target_dt_server.strftime("%H:%M")
+@lru_cache(maxsize=64)
+def _server_time(hour, minute, day):
+    """Server-local (weekday, HH:MM, naive datetime) for hour:minute on the given day in the app timezone.
+
+    Keyed by day so DST changes apply.
+    """
+    target_dt_santiago = datetime(day.year, day.month, day.day, hour, minute, tzinfo=APP_TZ)
+    # astimezone() with no argument uses the server's local zone at that instant
+    target_dt_server = target_dt_santiago.astimezone().replace(tzinfo=None)
+    return WEEKDAYS[target_dt_server.weekday()], target_dt_server.strftime("%H:%M"), target_dt_server
 
 
 # === ADD MEMBER COMMAND ===
-@app.command("/add_member")
-def add_member(ack, respond, command):
-    ack()
-    user_id = command["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        respond(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
+# <name> <user_id> [<mm-dd>] <yes/no>
+ADD_MEMBER_RE = re.compile(
+    r"^(?P<name>.+?)\s+(?P<user_id>[UW][A-Z0-9]+)(?:\s+(?P<date>\d{2}-\d{2}))?\s+(?P<journal_club>(?i:yes|no))$"
+)
+
 
+@app.command("/add_member")
+@admin_only
+def add_member(respond, command):
     # Usage: /add_member <name> <user_id> [<mm-dd>] <yes/no>
-    args = command["text"].strip().split()
-    if len(args) < 3:
+    match = ADD_MEMBER_RE.match(command["text"].strip())
+    if not match:
         respond("❌ Usage: `/add_member <name> <user_id> [<mm-dd>] <yes/no>` (birthday is optional)")
         return
 
-    # Try to detect if the third argument is a date (mm-dd)
-    name = []
-    date = ""
-    user_id_arg = ""
-    journal_club = ""
-
-    # If the second-to-last argument looks like a date, use it
-    if len(args) >= 4 and len(args[-2]) == 5 and args[-2][2] == "-":
-        name = args[:-3]
-        user_id_arg = args[-3]
-        date = args[-2]
-        journal_club = args[-1]
-    else:
-        name = args[:-2]
-        user_id_arg = args[-2]
-        date = ""
-        journal_club = args[-1]
-
-    name_str = " ".join(name)
-    journal_club = journal_club.lower()
+    name_str = " ".join(match["name"].split())
+    user_id_arg = match["user_id"]
+    date = match["date"] or ""
+    journal_club = match["journal_club"].lower()
 
     # Write to CSV, always with newline=''
-    file_exists = os.path.isfile(MEMBERS_FILE)
     with open(MEMBERS_FILE, mode="a", newline="") as csvfile:
-        fieldnames = ["name", "user_id", "date", "journal_club"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        if not file_exists or os.stat(MEMBERS_FILE).st_size == 0:
+        writer = csv.DictWriter(csvfile, fieldnames=Member._fields)
+        if csvfile.tell() == 0:
             writer.writeheader()
         writer.writerow({
             "name": name_str,
@@ -352,83 +710,71 @@ def add_member(ack, respond, command):
             "date": date,
             "journal_club": journal_club
         })
+    invalidate_csv_cache(MEMBERS_FILE)
 
     respond(f"✅ Added member: {name_str} ({user_id_arg})" + (f" with birthday {date}" if date else " (no birthday set)"))
 
 
 # === REMOVE MEMBER COMMAND ===
 @app.command("/remove_member")
-def remove_member(ack, respond, command):
-    ack()
-    user_id = command["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        respond(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
+@admin_only
+def remove_member(respond, command):
     try:
         user_id_to_remove = command["text"].strip()
         if not user_id_to_remove:
             respond("❌ Usage: `/remove_member <user_id>`")
             return
 
-        if not os.path.isfile(MEMBERS_FILE):
+        try:
+            members_by_id = read_csv_by_id(MEMBERS_FILE)
+        except FileNotFoundError:
             respond("❌ No members file found.")
             return
 
-        rows = []
-        removed = False
-
-        with open(MEMBERS_FILE, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row["user_id"] != user_id_to_remove:
-                    rows.append(row)
-                else:
-                    removed = True
-
-        if removed:
-            with open(MEMBERS_FILE, mode="w", newline="") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=["name", "user_id", "date", "journal_club"])
-                writer.writeheader()
-                writer.writerows(rows)
-            respond(f"✅ Removed member with user_id {user_id_to_remove}")
-        else:
+        if user_id_to_remove not in members_by_id:
             respond(f"❌ No member found with user_id {user_id_to_remove}")
+            return
+
+        rows = [row for row in read_csv_cached(MEMBERS_FILE) if row.user_id != user_id_to_remove]
+
+        def write_members(csvfile):
+            writer = csv.DictWriter(csvfile, fieldnames=Member._fields)
+            writer.writeheader()
+            writer.writerows(row._asdict() for row in rows)
+
+        atomic_write(MEMBERS_FILE, write_members)
+        invalidate_csv_cache(MEMBERS_FILE)
+        respond(f"✅ Removed member with user_id {user_id_to_remove}")
 
     except Exception as e:
         respond(f"❌ Error removing member: {e}")
 
 
 @app.command("/show_config")
-def show_config(ack, say, command):
-    ack()
-    user_id = command["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        say(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
+@admin_only
+def show_config(say):
+    with _state_lock:
+        meeting_day, reminder_day, reminder_hour = MEETING_DAY, REMINDER_DAY, REMINDER_HOUR
     say(
         f"*Current Meeting Configuration:*\n"
-        f"- Meeting day: `{MEETING_DAY.capitalize()}`\n"
-        f"- Reminder day: `{REMINDER_DAY.capitalize()}`\n"
-        f"- Reminder hour: `{REMINDER_HOUR}`"
+        f"- Meeting day: `{meeting_day.capitalize()}`\n"
+        f"- Reminder day: `{reminder_day.capitalize()}`\n"
+        f"- Reminder hour: `{reminder_hour}`"
     )
 
 
 @app.command("/show_members")
-def show_members(ack, say, command):
-    ack()
-    user_id = command["user_id"]
-    if user_id != AUTHORIZED_USER_ID:
-        say(f"Sorry <@{user_id}>, you're not authorized to run this command.")
-        return
-    if not os.path.exists(MEMBERS_FILE):
+@admin_only
+def show_members(say):
+    try:
+        rows = read_csv_cached(MEMBERS_FILE)
+    except FileNotFoundError:
         say("No members file found.")
         return
-    with open(MEMBERS_FILE, newline='') as csvfile:
-        reader = csv.DictReader(csvfile)
-        members = [
-            f"- {row['name']} | Birthday: {row['date'] if row['date'] else 'N/A'} | Journal Club: {row['journal_club']}"
-            for row in reader
-        ]
+    members = [
+        f"- {row.name} | Birthday: {row.date if row.date else 'N/A'} | Journal Club: {row.journal_club}"
+        for row in rows
+    ]
     if not members:
         say("No members found.")
     else:
@@ -438,29 +784,32 @@ def show_members(ack, say, command):
 @app.command("/group_webpage")
 def group_webpage(ack, say, command):
     ack()
-    url = os.environ.get("GROUP_WEBPAGE_URL")
+    url = ENV.group_webpage_url
     if url:
         say(f"🌐 Group webpage: {url}")
     else:
         say("Group webpage URL is not configured in the .env file.")
 
 
-# === START BOT & SCHEDULER ===
-if __name__ == "__main__":
-    server_time_str = get_server_time_for_santiago(HH, MM)
-    schedule.every().day.at(server_time_str).do(check_and_send_birthday_messages)
+def run_scheduler():
+    """Run pending jobs, then sleep until the next one is due or we are woken up."""
+    while True:
+        schedule.run_pending()
+        idle = schedule.idle_seconds()
+        if idle is None:
+            idle = MAX_SCHEDULER_SLEEP  # No jobs scheduled
+        elif idle < 0:
+            idle = 0
+        scheduler_wakeup.wait(min(idle, MAX_SCHEDULER_SLEEP))
+        scheduler_wakeup.clear()
 
-    # Schedule reminder for presenter using only the schedule library
-    server_reminder_time = get_server_time_for_santiago(
-        int(REMINDER_HOUR.split(":")[0]),
-        int(REMINDER_HOUR.split(":")[1])
-    )
-    getattr(schedule.every(), REMINDER_DAY).at(server_reminder_time).do(send_journal_reminder).tag("weekly_reminder")
 
-    def run_scheduler():
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
+# === START BOT & SCHEDULER ===
+if __name__ == "__main__":
+    # Schedule birthdays and the presenter reminder through the same path /configure_meeting uses
+    reload_schedules()
+    # Re-check the server times hourly so a DST change in either timezone moves the jobs
+    schedule.every().hour.do(reload_schedules)
 
     Thread(target=run_scheduler, daemon=True).start()
-    SocketModeHandler(app, os.environ["SLACK_APP_TOKEN"]).start()
+    SocketModeHandler(app, ENV.slack_app_token).start()
@@ -0,0 +1,209 @@
+import importlib
+import os
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Event
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+import schedule
+import slack_sdk
+from slack_bolt.request import BoltRequest
+from slack_sdk.web import SlackResponse
+
+# The scheduler maths below assumes a UTC server running the default America/Santiago app timezone
+os.environ["TZ"] = "UTC"
+time.tzset()
+for name in ("SLACK_API_TOKEN", "SLACK_APP_TOKEN", "ADMIN_USER_ID", "JOURNAL_CHANNEL_ID"):
+    os.environ.setdefault(name, "test")
+os.environ["TIMEZONE"] = "America/Santiago"
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+AUTH_TEST = SlackResponse(client=None, http_verb="POST", api_url="auth.test", req_args={}, headers={},
+                          status_code=200, data={"ok": True, "user_id": "UBOT", "bot_id": "BBOT", "team_id": "T1"})
+with mock.patch.object(slack_sdk.WebClient, "auth_test", return_value=AUTH_TEST):
+    app = importlib.import_module("app")
+
+
+class FakeClock:
+    """Drives datetime.now() for both app and schedule."""
+
+    def __init__(self, start):
+        self.now = start
+        clock = self
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock.now if tz is None else clock.now.astimezone().astimezone(tz)
+
+        self.datetime = FakeDatetime
+
+    @contextmanager
+    def installed(self):
+        with mock.patch("app.datetime", self.datetime), mock.patch("schedule.datetime.datetime", self.datetime):
+            yield
+
+
+class ReloadSchedulesTest(unittest.TestCase):
+    def setUp(self):
+        schedule.clear()
+        app._armed_jobs.clear()
+        app._server_time.cache_clear()
+        self.addCleanup(schedule.clear)
+        self.addCleanup(app._armed_jobs.clear)
+
+    def test_birthday_job_runs_once_per_day_across_dst_change(self):
+        # Chile leaves DST at 2027-04-04 00:00 local, so 12:30 moves from 15:30 to 16:30 UTC
+        clock = FakeClock(datetime(2027, 4, 3, 0, 0))
+        runs = []
+        with clock.installed(), \
+                mock.patch("app.check_and_send_birthday_messages", lambda: runs.append(clock.now)), \
+                mock.patch("app.send_journal_reminder", lambda: None):
+            app.reload_schedules()
+            schedule.every().hour.do(app.reload_schedules)
+            while clock.now < datetime(2027, 4, 6, 0, 0):
+                schedule.run_pending()
+                clock.now += timedelta(minutes=1)
+
+        self.assertEqual(runs, [
+            datetime(2027, 4, 3, 15, 30),
+            datetime(2027, 4, 4, 16, 30),
+            datetime(2027, 4, 5, 16, 30),
+        ])
+
+    def test_weekly_reminder_keeps_app_timezone_weekday(self):
+        # Thursday 23:01 in Santiago is Friday 02:01 or 03:01 UTC, across the same DST change
+        clock = FakeClock(datetime(2027, 3, 29, 0, 0))
+        runs = []
+        with clock.installed(), \
+                mock.patch.multiple("app", REMINDER_DAY="thursday", REMINDER_H=23, REMINDER_M=1), \
+                mock.patch("app.check_and_send_birthday_messages", lambda: None), \
+                mock.patch("app.send_journal_reminder", lambda: runs.append(clock.now)):
+            app.reload_schedules()
+            schedule.every().hour.do(app.reload_schedules)
+            while clock.now < datetime(2027, 4, 12, 0, 0):
+                schedule.run_pending()
+                clock.now += timedelta(minutes=1)
+
+        santiago = ZoneInfo("America/Santiago")
+        self.assertEqual([run.astimezone().astimezone(santiago).strftime("%A %H:%M") for run in runs],
+                         ["Thursday 23:01", "Thursday 23:01"])
+
+
+class LoadCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(app._csv_cache.clear)
+
+    def write(self, text):
+        path = os.path.join(self.tmpdir.name, "members.csv")
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return path
+
+    def test_missing_column_and_short_rows_default_to_empty(self):
+        path = self.write("user_id,name,date\nU1,Ann,03-15\nU2,Bob\n\n")
+        self.assertEqual(app.read_csv_cached(path), [
+            app.Member(name="Ann", user_id="U1", date="03-15", journal_club=""),
+            app.Member(name="Bob", user_id="U2", date="", journal_club=""),
+        ])
+        self.assertEqual(list(app.read_csv_by_birthday(path)), [315])
+
+
+class AtomicWriteTest(unittest.TestCase):
+    def test_failed_write_keeps_original_and_leaves_no_temp_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, "config.json")
+        app.atomic_write(path, lambda f: f.write("old"))
+
+        def fail(f):
+            f.write("partial")
+            raise OSError("disk full")
+
+        with self.assertRaises(OSError):
+            app.atomic_write(path, fail)
+        self.assertEqual(os.listdir(tmpdir.name), ["config.json"])
+        with open(path) as f:
+            self.assertEqual(f.read(), "old")
+
+
+class ParseHourTest(unittest.TestCase):
+    def test_accepts_what_strptime_accepted(self):
+        self.assertEqual(app.parse_hour("9:5"), (9, 5))
+        self.assertEqual(app.parse_hour("23:01"), (23, 1))
+
+    def test_rejects_invalid(self):
+        for text in ("24:00", "12:60", "1230", "12:345", "ab:cd", ""):
+            self.assertIsNone(app.parse_hour(text), text)
+
+
+class NextPresenterTest(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.legacy = os.path.join(tmpdir.name, "reminder.csv")
+        self.current = os.path.join(tmpdir.name, "next_presenter.json")
+        for patcher in (
+            mock.patch("app.LEGACY_REMINDER_FILE", self.legacy),
+            mock.patch("app.NEXT_PRESENTER_FILE", self.current),
+            mock.patch("app._next_presenter", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_migrates_legacy_reminder_csv(self):
+        with open(self.legacy, "w", newline="") as f:
+            f.write("name,user_id,date,journal_club\nAnn,U1,03-15,yes\n")
+        expected = app.Member(name="Ann", user_id="U1", date="03-15", journal_club="yes")
+        self.assertEqual(app.get_next_presenter(), expected)
+        self.assertFalse(os.path.exists(self.legacy))
+
+        with mock.patch("app._next_presenter", None):  # Cold start again: now read from JSON
+            self.assertEqual(app.get_next_presenter(), expected)
+
+    def test_no_presenter_selected(self):
+        self.assertIsNone(app.get_next_presenter())
+
+
+class AdminOnlyDispatchTest(unittest.TestCase):
+    def dispatch_show_config(self, user_id):
+        """Send /show_config through Bolt and return the text the bot posted back."""
+        posted = Event()
+        body = {"type": "slash_command", "command": "/show_config", "text": "", "user_id": user_id,
+                "channel_id": "C1", "team_id": "T1", "response_url": "https://hooks.slack.test/1"}
+        with mock.patch.object(slack_sdk.WebClient, "chat_postMessage",
+                               side_effect=lambda **kwargs: posted.set()) as post:
+            response = app.app.dispatch(BoltRequest(body=body, mode="socket_mode"))
+            self.assertTrue(posted.wait(5))
+        self.assertEqual(response.status, 200)
+        return post.call_args.kwargs["text"]
+
+    def test_admin_gets_config(self):
+        self.assertIn("Current Meeting Configuration", self.dispatch_show_config(app.ENV.admin_user_id))
+
+    def test_other_user_is_refused(self):
+        self.assertEqual(self.dispatch_show_config("UOTHER"),
+                         "Sorry <@UOTHER>, you're not authorized to run this command.")
+
+
+class AddMemberRegexTest(unittest.TestCase):
+    def test_parses_optional_birthday(self):
+        match = app.ADD_MEMBER_RE.match("Ann Lee U1AB 03-15 YES")
+        self.assertEqual(match.groupdict(), {"name": "Ann Lee", "user_id": "U1AB", "date": "03-15", "journal_club": "YES"})
+        self.assertIsNone(app.ADD_MEMBER_RE.match("Bob U2 no")["date"])
+
+    def test_rejects_lowercase_user_id_and_bad_date(self):
+        self.assertIsNone(app.ADD_MEMBER_RE.match("Ann u789 yes"))
+        self.assertIsNone(app.ADD_MEMBER_RE.match("Ann U789 ab-cd yes"))
+
+
+if __name__ == "__main__":
+    unittest.main()